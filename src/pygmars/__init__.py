@@ -6,6 +6,7 @@
 #
 
 import re
+import sys
 from collections import namedtuple
 
 
@@ -40,6 +41,12 @@ class Token:
     def __str__(self, *args, **kwargs):
         return f"Token(value={self.value!r}, label={self.label!r}, start_line={self.start_line}, pos={self.pos})"
 
+    def __eq__(self, other):
+        return isinstance(other, Token) and self.value == other.value and self.label == other.label
+
+    def __hash__(self):
+        return hash((self.value, self.label))
+
     def to_dict(self):
         return dict(label=self.label, value=self.value, start_line=self.start_line, pos=self.pos)
 
@@ -139,4 +146,7 @@ def as_token_label(s):
     s = only_wordchars(" ", s)
     s = " ".join(s.split())
     s = s.replace(" ", "-").replace("--", "-").strip("-").lstrip("0123456789")
-    return s
+    # labels come from a small vocabulary and are compared over and over when
+    # parsing: interning makes these comparisons pointer checks and shares a
+    # single string object per label across all tokens and trees
+    return sys.intern(s)
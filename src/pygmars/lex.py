@@ -45,6 +45,66 @@ class InvalidLexerMatcher(Exception):
     """
 
 
+# regex constructs that cannot be safely combined in one alternation because
+# their meaning depends on group numbering or applies to the whole pattern:
+# numeric backreferences, named groups and references, conditionals and
+# global inline flags
+is_unsafe_to_fuse = re.compile(r"\\\d|\(\?P|\(\?\(|\(\?[aiLmsux-]+\)").search
+
+
+def build_matcher_chain(matchers, re_flags=0, max_groups=99):
+    """
+    Return a list of ``(matcher, labels)`` links built from a ``matchers``
+    list of ``(matcher callable, pattern string or None, label)`` tuples.
+
+    Runs of consecutive plain regexes are fused into a single alternation of
+    named groups, so one re.match call tries the whole run at once; the
+    leftmost matching alternative wins, preserving the original matcher
+    order. ``labels`` is a dict mapping the matched group name to its label
+    for a fused link, or the matcher's own label object (which need not be a
+    string) for a single-matcher link. Callables
+    and regexes using constructs that do not survive fusing (backreferences,
+    named groups, global inline flags) stay as single links, capping runs at
+    ``max_groups`` regex groups each.
+    """
+    chain = []
+    append_link = chain.append
+    run = []  # consecutive (matcher, pattern, label) that are safe to fuse
+    group_count = 0
+
+    def flush_run():
+        if len(run) > 1:
+            fused = "|".join(f"(?P<g{i}>{pattern})" for i, (_, pattern, _l) in enumerate(run))
+            labels_by_group = {f"g{i}": label for i, (_, _p, label) in enumerate(run)}
+            try:
+                append_link((re.compile(fused, flags=re_flags).match, labels_by_group))
+                del run[:]
+                return
+            except re.error:
+                # an exotic pattern that compiles alone but not in an
+                # alternation: keep the matchers separate
+                pass
+        for matcher, _pattern, label in run:
+            append_link((matcher, label))
+        del run[:]
+
+    for matcher, pattern, label in matchers:
+        if pattern is None or is_unsafe_to_fuse(pattern):
+            flush_run()
+            group_count = 0
+            append_link((matcher, label))
+            continue
+        # the wrapping named group adds one to the pattern's own group count
+        groups = 1 + matcher.__self__.groups
+        if group_count + groups > max_groups:
+            flush_run()
+            group_count = 0
+        run.append((matcher, pattern, label))
+        group_count += groups
+    flush_run()
+    return chain
+
+
 class Lexer:
     """
     Regular Expression Lexer
@@ -97,24 +157,32 @@ class Lexer:
 
         self._matchers = []
         append_matcher = self._matchers.append
+        with_patterns = []
         try:
             for m, label in matchers:
                 # if this is string we compile as re and get a callable.
                 if isinstance(m, str):
                     mtc = re.compile(m, flags=re_flags).match
+                    pattern = m
                 else:
                     # Otherwise we assume this is some callable.
                     mtc = m
+                    pattern = None
                 append_matcher(
                     (
                         mtc,
                         label,
                     )
                 )
+                with_patterns.append((mtc, pattern, label))
 
         except (Exception, FutureWarning) as e:
             raise InvalidLexerMatcher(f"Invalid Lexer matcher: {m!r}, label: {label}") from e
 
+        # fuse runs of plain regexes in one alternation each so that labelling
+        # a token costs a few re.match calls instead of one per matcher
+        self._chain = build_matcher_chain(with_patterns, re_flags=re_flags)
+
     def tokenize(self, string, splitter=str.split):
         """
         Return an iterable of pygmars.Tokens given a ``string`` split with the
@@ -147,14 +215,28 @@ class Lexer:
         Assign a "label" to every token whose value is matched by one of regexp
         rules of this lexer.
         """
-        matchers = self._matchers
-        for tidx, token in enumerate(tokens):
-            for midx, (matcher, label) in enumerate(matchers):
-                if matcher(token.value):
-                    if trace:
+        if trace:
+            # trace reports per original matcher: use the unfused matchers so
+            # the matcher indexes and patterns printed stay meaningful
+            matchers = self._matchers
+            for tidx, token in enumerate(tokens):
+                for midx, (matcher, label) in enumerate(matchers):
+                    if matcher(token.value):
                         _trace_lex(tidx, token, midx, matcher, label)
+                        token.label = label
+                        break
+                yield token
+            return
 
-                    token.label = label
+        chain = self._chain
+        for token in tokens:
+            value = token.value
+            for matcher, labels in chain:
+                match = matcher(value)
+                if match:
+                    # only fused links carry a group-to-label dict; single
+                    # matchers keep their label object, whatever it is
+                    token.label = labels[match.lastgroup] if labels.__class__ is dict else labels
                     break
             yield token
 
@@ -97,7 +97,7 @@ an equivalent regular expression pattern which is then used internally over the
 # http://nltk.org/book
 
 import re
-from functools import partial
+from functools import lru_cache
 
 from pygmars import as_token_label
 from pygmars.tree import Tree
@@ -126,6 +126,9 @@ class Parser:
     time the corresponding pattern is applied.
     """
 
+    # keep memory requirements low by preventing creation of instance dicts
+    __slots__ = ("_grammar", "rules", "_root_label", "_loop", "_trace", "_validate")
+
     def __init__(self, grammar, root_label="ROOT", loop=1, trace=0, validate=False):
         """
         Create a new Parser from a ``grammar`` string and a ``root_label``.
@@ -160,13 +163,34 @@ class Parser:
         if not isinstance(tree, Tree):
             tree = Tree(self._root_label, tree)
 
+        # hoisted to locals to avoid repeated attribute lookups in the loop
+        rules = self.rules
+
         for i in range(self._loop):
             if trace:
                 print(f"\nparse: loop# {i}")
-            for parse_rule in self.rules:
-                tree = parse_rule.parse(tree=tree, trace=trace)
+            changed = False
+            for parse_rule in rules:
+                parsed = parse_rule.parse(tree=tree, trace=trace)
+                if parsed is not tree:
+                    changed = True
+                    tree = parsed
+            if not changed:
+                # a full pass without changes is a fixpoint: further loop
+                # iterations would reparse the same tree for the same result
+                break
         return tree
 
+    def parse_all(self, trees):
+        """
+        Apply this parser to each item of the ``trees`` iterable of parse Trees
+        (or lists of Tokens) and return a list of parse Trees. This amortizes
+        the per-parse setup when parsing many token sequences with the same
+        grammar.
+        """
+        parse = self.parse
+        return [parse(tree) for tree in trees]
+
     def __repr__(self):
         return f"<Parser with {len(self.rules)} rules>"
 
@@ -202,6 +226,9 @@ class ParseString:
 
     """
 
+    # keep memory requirements low by preventing creation of instance dicts
+    __slots__ = ("_root_label", "_tree", "_labels", "_parse_string", "_validate")
+
     # Anything that's not a delimiter such as <> or {}
     LABEL_CHARS = r"[^\{\}<>]"
     LABEL = rf"(<{LABEL_CHARS}+>)"
@@ -215,7 +242,12 @@ class ParseString:
         """
         self._root_label = tree.label
         self._tree = tree
-        self._parse_string = "".join(f"<{p.label}>" for p in tree)
+        # the labels are precomputed once: they are needed to build the parse
+        # string and again each time ``validate`` checks tags are unchanged
+        self._labels = [p.label for p in tree]
+        # a list comprehension (rather than a generator) lets join() size its
+        # result upfront: this is the hottest loop of rule application
+        self._parse_string = "".join([build_label_fragment(label) for label in self._labels])
         self._validate = validate
 
     def validate(self, s):
@@ -237,7 +269,7 @@ class ParseString:
             raise ValueError(f"Invalid parse: unbalanced or nested curly braces:\n  {s}")
 
         tags1 = tag_splitter(s)[1:-1]
-        tags2 = [node.label for node in self._tree]
+        tags2 = self._labels
         if tags1 != tags2:
             raise ValueError(f"Invalid parse: tag changed:\n  {s}")
 
@@ -270,22 +302,26 @@ class ParseString:
         #  not match, match,   not match, match,    match
         for piece in pieces_splitter(self._parse_string):
 
-            # Find the list of tokens contained in this piece.
-            length = piece.count("<")
-            subsequence = tree[index : index + length]
+            # Empty pieces are common (e.g. before a leading group or between
+            # adjacent groups) and carry no tokens: only flip the match state.
+            if piece:
+                # Find the list of tokens contained in this piece.
+                length = piece.count("<")
+                subsequence = tree[index : index + length]
 
-            # Add this list of tokens to our tree.
-            if matched:
-                parse_tree.append(Tree(label, subsequence))
-            else:
-                parse_tree.extend(subsequence)
+                # Add this list of tokens to our tree.
+                if matched:
+                    parse_tree.append(Tree(label, subsequence))
+                else:
+                    parse_tree.extend(subsequence)
+
+                index += length
 
-            index += length
             matched = not matched
 
         return parse_tree
 
-    def apply_transform(self, transformer):
+    def apply_transform(self, transformer, may_match_empty=True):
         """
         Apply the given ``transformer`` callable transformation to the string
         encoding of this ``ParseString``.
@@ -298,6 +334,11 @@ class ParseString:
         ``transformer`` is a callable that accepts a string and returns a
         string. Raise ValueError if this transformation generates an invalid
         ParseString.
+
+        ``may_match_empty`` tells whether the transformation can match the
+        empty string and hence generate empty groups. Callers that know their
+        pattern always matches at least one label (such as Rule) can pass
+        False to skip the empty-group cleanup pass.
         """
         # Do the actual substitution
         s = transformer(self._parse_string)
@@ -305,7 +346,8 @@ class ParseString:
         # The substitution might have generated "empty groups"
         # (substrings of the form "{}").  Remove them, so they don't
         # interfere with other transformations.
-        s = s.replace("{}", "")
+        if may_match_empty:
+            s = s.replace("{}", "")
 
         # Make sure that the transformation was legal.
         if self._validate:
@@ -315,6 +357,30 @@ class ParseString:
         self._parse_string = s
         return s
 
+    def apply_substitution(self, pattern, repl, may_match_empty=True):
+        """
+        Apply the ``pattern`` compiled pattern substitution with the ``repl``
+        replacement to the string encoding of this ``ParseString`` and return
+        the number of substitutions made.
+
+        This behaves as ``apply_transform`` but reports match counts: when
+        nothing matched, the string is untouched and all post-processing
+        (empty-group cleanup and validation) is skipped.
+        """
+        s, matched = pattern.subn(repl, self._parse_string)
+        if not matched:
+            return 0
+
+        # See apply_transform for why empty groups are removed.
+        if may_match_empty:
+            s = s.replace("{}", "")
+
+        if self._validate:
+            self.validate(s)
+
+        self._parse_string = s
+        return matched
+
     def __repr__(self):
         return f"<ParseString: {self._parse_string!r}>"
 
@@ -325,64 +391,89 @@ class ParseString:
         with the representation of other ``ParseString`` for the same text,
         regardless of the grouping.
         """
-        # Add spaces to make everything line up.
-        s = re.sub(r">(?!\})", r"> ", self._parse_string)
-        s = re.sub(r"([^\{])<", r"\1 <", s)
-        if s[0] == "<":
-            s = " " + s
+        # Add spaces to make everything line up: a space goes after each ">"
+        # not followed by "}" and before each "<" not preceded by "{". Plain
+        # str.replace pairs run at C speed and avoid regex lookarounds; the
+        # second replace of each pair undoes the space at brace boundaries.
+        s = self._parse_string.replace(">", "> ").replace("> }", ">}")
+        s = s.replace("<", " <").replace("{ <", "{<")
         return s.rstrip()
 
 
 # used to split a ParseString on labels and braces delimiters
 tag_splitter = re.compile(r"[\{\}<>]+").split
 
-# return only {} curly brackets aka. braces
-get_curly_braces = partial(re.compile(r"[^\{\}]+").sub, "")
+# replace each braces-delimited group, used to render trace output
+replace_groups = re.compile(r"\{[^\{]+\}").sub
+
+
+@lru_cache(maxsize=1024)
+def build_label_fragment(label):
+    """
+    Return the ``<label>`` angle-bracketed fragment for a ``label`` string.
+    Labels come from a small vocabulary repeated across every ParseString
+    build, so each fragment is formatted once and reused from the cache.
+    """
+    return f"<{label}>"
 
-# remove {4,} regex quantifiers
-remove_quantifiers = partial(re.compile(r"\{\d+(?:,\d+)?\}").sub, "")
+
+@lru_cache(maxsize=1024)
+def build_pattern(regexp):
+    """
+    Return a compiled pattern for the ``regexp`` string. Compiled patterns are
+    cached: applications that rebuild the same grammar (and hence the same
+    Rules) repeatedly skip regex compilation entirely after the first build.
+    """
+    return re.compile(regexp)
 
 
 def has_balanced_non_nested_curly_braces(string):
     """
     Return True if ``string`` contains balanced and non-nested curly braces.
 
-    Approach:
-    - remove regex quantifiers
-    - remove all non-braces characters
-    - remove all balanced brace pairs.
-    If there is nothing left, then braces are balanced and not nested.
-
-    Balanced but nested:
-    >>> "{{}}".replace("{}", "")
-    '{}'
-
-    Unbalanced:
-    >>> "{{}{}".replace("{}", "")
-    '{'
-    >>> "{}{}}{}".replace("{}", "")
-    '}'
-
-    Balanced an not nested:
-    >>> "{}{}{}".replace("{}", "")
-    ''
-    >>> remove_quantifiers("foo{4}")
-    'foo'
-    >>> remove_quantifiers("foo{}")
-    'foo{}'
-    >>> remove_quantifiers("foo{4}")
-    'foo'
-    >>> remove_quantifiers("foo{4,5}")
-    'foo'
+    The braces of a balanced, non-nested string strictly alternate: every
+    ``{`` is followed by a ``}`` before any other brace occurs. Regex
+    quantifiers such as ``{4,}`` form balanced pairs of their own.
 
     >>> has_balanced_non_nested_curly_braces("{}{}{}")
     True
     >>> has_balanced_non_nested_curly_braces("{{}{}{}")
     False
+    >>> has_balanced_non_nested_curly_braces("{{}}")
+    False
+    >>> has_balanced_non_nested_curly_braces("{}{}}{}")
+    False
+    >>> has_balanced_non_nested_curly_braces("foo{4,5}")
+    True
+    >>> has_balanced_non_nested_curly_braces("no braces at all")
+    True
     """
-    cb = get_curly_braces(string)
-    cb = remove_quantifiers(cb)
-    return bool(not cb.replace("{}", ""))
+    # cheap C-level counting rejects unbalanced strings (and accepts
+    # brace-free ones, the common case) in a single pass
+    opens = string.count("{")
+    if opens != string.count("}"):
+        return False
+    if not opens:
+        return True
+
+    # walk brace positions only, with C-level find calls: each pair must
+    # strictly alternate as {...} with no other brace in between
+    find = string.find
+    pos = 0
+    while True:
+        open_at = find("{", pos)
+        if open_at == -1:
+            # the counts above guarantee no stray "}" remains either
+            return True
+        close_at = find("}", pos)
+        if close_at < open_at:
+            # a "}" before any "{" can only close an unopened group
+            return False
+        next_open = find("{", open_at + 1)
+        if next_open != -1 and next_open < close_at:
+            # a second "{" before the closing "}" means nesting
+            return False
+        pos = close_at + 1
 
 
 # this should probably be made more strict than it is -- e.g., it
@@ -393,7 +484,11 @@ is_label_pattern = re.compile(
 
 remove_spaces = re.compile(r"\s").sub
 
+# rewrite '<' and '>' so they act as grouping parentheses, in a single pass
+parenthesize_angle_brackets = str.maketrans({"<": "(?:<(?:", ">": ")>)"})
+
 
+@lru_cache(maxsize=1024)
 def label_pattern_to_regex(label_pattern):
     """
     Return a regular expression pattern converted from ``label_pattern``.  A
@@ -430,7 +525,7 @@ def label_pattern_to_regex(label_pattern):
     should not contain nested or mismatched angle-brackets.
     """
     # Clean up the regular expression
-    label_pattern = remove_spaces("", label_pattern).replace("<", "(?:<(?:").replace(">", ")>)")
+    label_pattern = remove_spaces("", label_pattern).translate(parenthesize_angle_brackets)
 
     # Check the regular expression
     if not is_label_pattern(label_pattern):
@@ -448,6 +543,19 @@ class Rule:
     regular expression substitution.
     """
 
+    # keep memory requirements low by preventing creation of instance dicts
+    __slots__ = (
+        "pattern",
+        "label",
+        "description",
+        "_root_label",
+        "_regexp",
+        "_repl",
+        "_pattern",
+        "_may_match_empty",
+        "_validate",
+    )
+
     def __init__(
         self,
         pattern,
@@ -473,7 +581,10 @@ class Rule:
         self._regexp = regexp
         # the replacement wraps matched tokens in curly braces
         self._repl = "{\\g<group>}"
-        self._transformer = partial(re.compile(regexp).sub, self._repl)
+        self._pattern = build_pattern(regexp)
+        # a pattern that cannot match the empty string can never generate an
+        # empty {} group: apply_transform then skips its cleanup pass
+        self._may_match_empty = bool(self._pattern.match(""))
         self._validate = validate
         if validate:
             self.validate()
@@ -515,17 +626,22 @@ class Rule:
 
         parse_string = ParseString(tree, validate=self._validate)
 
-        before_parse = str(parse_string)
         if trace:
             trace_elements = []
             initial_tree_len = len(tree)
+            before_parse = str(parse_string)
 
-        parse_string.apply_transform(self._transformer)
-        after_parse = str(parse_string)
-        if after_parse != before_parse:
+        before = parse_string._parse_string
+        matched = parse_string.apply_substitution(
+            pattern=self._pattern,
+            repl=self._repl,
+            may_match_empty=self._may_match_empty,
+        )
+        if matched and parse_string._parse_string != before:
             # only update the tree and the trace if there have been changes from this parse
             if trace:
-                updated = re.sub(r"\{[^\{]+\}", f" <{self.label}> ", after_parse)
+                after_parse = str(parse_string)
+                updated = replace_groups(f" <{self.label}> ", after_parse)
                 trace_elements.append("-------------------------------------")
                 trace_elements.append(f"Rule.parse: applied rule: {self!r}")
                 trace_elements.append(f"  Rule regex: {self._regexp}")
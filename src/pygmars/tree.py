@@ -58,9 +58,43 @@ The node label is accessed using the `label` attribute:
 # http://nltk.org/book
 
 import re
+import sys
+from functools import lru_cache
 from typing import Generator
 
 
+# used by the from_string scanner to jump over character runs in a single
+# C-level call rather than one Python-level test per character
+find_non_space = re.compile(r"\S").search
+find_token_end = re.compile(r"[\s()]").search
+
+
+@lru_cache(maxsize=128)
+def build_child_pad(indent):
+    """
+    Return the newline-plus-spaces prefix printed before each child at
+    ``indent``, caching one string per indentation depth.
+    """
+    return "\n" + " " * (indent + 2)
+
+
+@lru_cache(maxsize=32)
+def build_token_pattern(open_pattern, close_pattern, node_pattern, leaf_pattern):
+    """
+    Return a compiled regex that tokenizes a bracketed tree string, caching
+    the compiled pattern: callers use the same few bracket and node/leaf
+    patterns over and over.
+    """
+    # the _open and _leaf groups let the token loop dispatch on which
+    # alternative matched instead of re-inspecting the token text; names are
+    # used rather than numbers so custom node/leaf patterns may contain their
+    # own capture groups
+    return re.compile(
+        r"(?P<_open>%s\s*(%s)?)|%s|(?P<_leaf>%s)"
+        % (open_pattern, node_pattern, close_pattern, leaf_pattern)
+    )
+
+
 class Tree(list):
     """
     A Tree represents a hierarchical grouping of leaves and subtrees. For
@@ -145,6 +179,9 @@ class Tree(list):
     methods, deletion and many more.
     """
 
+    #  keep memory requirements low by preventing creation of instance dicts.
+    __slots__ = ("label",)
+
     def __init__(self, label, children):
         if not label:
             raise TypeError(f"Expected a label value: {label!r}")
@@ -156,33 +193,42 @@ class Tree(list):
             raise TypeError(f"Children should be a list: {children!r}")
 
         list.__init__(self, children)
-        self.label = label
+        # labels come from a small grammar vocabulary repeated across many
+        # nodes: interning shares one string object per label and makes
+        # label comparisons pointer checks
+        self.label = sys.intern(label) if type(label) is str else label
 
     def __getitem__(self, index):
+        # plain integer indexing is by far the most common access: dispatch
+        # on the exact type first to skip the isinstance checks below
+        if type(index) is int:
+            return list.__getitem__(self, index)
         if isinstance(index, (int, slice)):
             return list.__getitem__(self, index)
         elif isinstance(index, (list, tuple)):
-            if len(index) == 0:
-                return self
-            elif len(index) == 1:
-                return self[index[0]]
-            else:
-                return self[index[0]][index[1:]]
+            # descend iteratively rather than recursing with index[1:],
+            # which would allocate a new tuple slice at every level
+            node = self
+            for i in index:
+                node = node[i]
+            return node
         else:
             raise TypeError(
                 "%s indices must be integers, not %s" % (type(self).__name__, type(index).__name__)
             )
 
     def __setitem__(self, index, value):
+        if type(index) is int:
+            return list.__setitem__(self, index, value)
         if isinstance(index, (int, slice)):
             return list.__setitem__(self, index, value)
         elif isinstance(index, (list, tuple)):
             if len(index) == 0:
                 raise IndexError("The tree position () may not be " "assigned to.")
-            elif len(index) == 1:
-                self[index[0]] = value
-            else:
-                self[index[0]][index[1:]] = value
+            node = self
+            for i in index[:-1]:
+                node = node[i]
+            node[index[-1]] = value
         else:
             raise TypeError(
                 "%s indices must be integers, not %s" % (type(self).__name__, type(index).__name__)
@@ -202,13 +248,45 @@ class Tree(list):
         :rtype: list
         """
         leaves = []
-        for child in self:
-            if isinstance(child, Tree):
-                leaves.extend(child.leaves())
+        append = leaves.append
+        # walk depth-first with an explicit stack rather than recursing: this
+        # visits the whole tree in a single call frame and has no
+        # recursion-depth ceiling on deep trees. Children are pushed in
+        # reverse so that popping preserves left-to-right leaf order.
+        stack = list(reversed(self))
+        pop = stack.pop
+        extend = stack.extend
+        # nodes are almost always exactly Tree: the identity check is a
+        # single pointer compare and isinstance only runs for subclasses
+        tree_class = Tree
+        while stack:
+            node = pop()
+            if node.__class__ is tree_class or isinstance(node, tree_class):
+                extend(reversed(node))
             else:
-                leaves.append(child)
+                append(node)
         return leaves
 
+    def iter_leaves(self):
+        """
+        Yield the leave nodes of this tree, left to right, without building
+        the list that ``leaves`` returns.
+
+        >>> t = Tree.from_string("(S (NP the dog) (VP barks))")
+        >>> list(t.iter_leaves())
+        ['the', 'dog', 'barks']
+        """
+        stack = list(reversed(self))
+        pop = stack.pop
+        extend = stack.extend
+        tree_class = Tree
+        while stack:
+            node = pop()
+            if node.__class__ is tree_class or isinstance(node, tree_class):
+                extend(reversed(node))
+            else:
+                yield node
+
     @classmethod
     def from_string(
         cls,
@@ -264,6 +342,16 @@ class Tree(list):
             raise TypeError("brackets must be a length-2 string")
         if contains_spaces(brackets):
             raise TypeError("whitespace brackets not allowed")
+
+        if brackets == "()" and node_pattern is None and leaf_pattern is None:
+            # the common case: scan the string directly by character index
+            # instead of running the tokenizing regexp. On malformed input
+            # this returns None and we fall through to the regexp walk below
+            # to report the error.
+            tree = cls._from_string_default(s, read_node, read_leaf)
+            if tree is not None:
+                return tree
+
         # Construct a regexp that will tokenize the string.
         open_b, close_b = brackets
         open_pattern, close_pattern = (re.escape(open_b), re.escape(close_b))
@@ -271,15 +359,14 @@ class Tree(list):
             node_pattern = r"[^\s%s%s]+" % (open_pattern, close_pattern)
         if leaf_pattern is None:
             leaf_pattern = r"[^\s%s%s]+" % (open_pattern, close_pattern)
-        token_re = re.compile(
-            r"%s\s*(%s)?|%s|(%s)" % (open_pattern, node_pattern, close_pattern, leaf_pattern)
-        )
+        token_re = build_token_pattern(open_pattern, close_pattern, node_pattern, leaf_pattern)
         # Walk through each token, updating a stack of trees.
         stack = [(None, [])]  # list of (node, children) tuples
         for match in token_re.finditer(s):
             token = match.group()
+            group = match.group
             # Beginning of a tree/subtree
-            if token[0] == open_b:
+            if group("_open") is not None:
                 if len(stack) == 1 and len(stack[0][1]) > 0:
                     cls._parse_error(s, match, "end-of-string")
                 label = token[1:].lstrip()
@@ -287,7 +374,7 @@ class Tree(list):
                     label = read_node(label)
                 stack.append((label, []))
             # End of a tree/subtree
-            elif token == close_b:
+            elif group("_leaf") is None:
                 if len(stack) == 1:
                     if len(stack[0][1]) == 0:
                         cls._parse_error(s, match, open_b)
@@ -315,6 +402,78 @@ class Tree(list):
 
         return tree
 
+    @classmethod
+    def from_strings(cls, strings):
+        """
+        Return a list of trees read from a ``strings`` iterable of bracketed
+        tree strings, using the default brackets and patterns. Parsing many
+        strings here amortizes the per-call setup of ``from_string``.
+
+        >>> trees = Tree.from_strings(["(S (NP I) (VP run))", "(S (NP he) (VP sits))"])
+        >>> [t.label for t in trees]
+        ['S', 'S']
+        """
+        from_string = cls.from_string
+        return [from_string(s) for s in strings]
+
+    @classmethod
+    def _from_string_default(cls, s, read_node=None, read_leaf=None):
+        """
+        Read a bracketed tree string ``s`` using the default "()" brackets and
+        default node and leaf patterns, scanning the string one character at a
+        time. Return the resulting tree, or None if ``s`` is malformed: error
+        reporting is left to the slower regexp-based walk in ``from_string``.
+        """
+        stack = [(None, [])]  # list of (node, children) tuples
+        # real inputs repeat the same leaf strings many times over: reuse one
+        # string object per distinct leaf instead of a fresh slice each time
+        leaf_cache = {}
+        leaf_cache_get = leaf_cache.setdefault
+        n = len(s)
+        i = 0
+        while i < n:
+            c = s[i]
+            if c == "(":
+                # Beginning of a tree/subtree
+                if len(stack) == 1 and stack[0][1]:
+                    return None
+                match = find_non_space(s, i + 1)
+                j = match.start() if match else n
+                match = find_token_end(s, j)
+                k = match.start() if match else n
+                label = s[j:k]
+                if read_node is not None:
+                    label = read_node(label)
+                stack.append((label, []))
+                i = k
+            elif c == ")":
+                # End of a tree/subtree
+                if len(stack) == 1:
+                    return None
+                label, children = stack.pop()
+                stack[-1][1].append(cls(label, children))
+                i += 1
+            elif c.isspace():
+                match = find_non_space(s, i + 1)
+                i = match.start() if match else n
+            else:
+                # Leaf node
+                if len(stack) == 1:
+                    return None
+                match = find_token_end(s, i + 1)
+                k = match.start() if match else n
+                token = s[i:k]
+                token = leaf_cache_get(token, token)
+                if read_leaf is not None:
+                    token = read_leaf(token)
+                stack[-1][1].append(token)
+                i = k
+
+        # check that we got exactly one complete tree.
+        if len(stack) != 1 or len(stack[0][1]) != 1:
+            return None
+        return stack[0][1][0]
+
     @classmethod
     def _parse_error(cls, s, match, expecting):
         """
@@ -367,20 +526,43 @@ class Tree(list):
             subsequent lines.
         :type indent: int
         """
-        closings = 0
-        if isinstance(self.label, str):
-            s = f"(label={self.label!r}, children=("
-            closings = 2
-        else:
-            s = ""
-
-        for child in self:
-            if isinstance(child, Tree):
-                s += "\n" + " " * (indent + 2) + child.pformat(indent=indent + 2)
-            elif isinstance(child, tuple):
-                s += "\n" + " " * (indent + 2) + "/".join(child)
-            elif isinstance(child, str):
-                s += "\n" + " " * (indent + 2) + f"{child}"
+        # accumulate string fragments in a list and join once: appending to a
+        # growing string would copy it over and over on large trees
+        parts = []
+        self._pformat(parts, indent)
+        return "".join(parts)
+
+    def _pformat(self, parts, indent):
+        append = parts.append
+        tree_class = Tree
+        # the stack holds ready string fragments and (subtree, indent) frames
+        # still to expand; expanding in place of recursing keeps deep trees
+        # within a single call frame
+        stack = [(self, indent)]
+        pop = stack.pop
+        while stack:
+            item = pop()
+            if isinstance(item, str):
+                append(item)
+                continue
+            node, node_indent = item
+            if isinstance(node.label, str):
+                append(f"(label={node.label!r}, children=(")
+                closings = "))"
             else:
-                s += "\n" + " " * (indent + 2) + repr(child)
-        return f"{s}" + (")" * closings)
+                closings = ""
+            pad = build_child_pad(node_indent)
+            pending = []
+            for child in node:
+                pending.append(pad)
+                if child.__class__ is tree_class or isinstance(child, tree_class):
+                    pending.append((child, node_indent + 2))
+                elif isinstance(child, tuple):
+                    pending.append("/".join(child))
+                elif isinstance(child, str):
+                    pending.append(child)
+                else:
+                    pending.append(repr(child))
+            if closings:
+                pending.append(closings)
+            stack.extend(reversed(pending))
@@ -40,3 +40,63 @@ class TestLexer(unittest.TestCase):
             Lexer(matchers)
         except InvalidLexerMatcher:
             pass
+
+    def test_Lexer_fuses_regex_runs_and_keeps_first_match_wins_order(self):
+        matchers = [
+            (r".*ing$", "VBG"),
+            (r".*s$", "NNS"),
+            (r".*", "NN"),
+        ]
+        lexer = Lexer(matchers)
+        # all three regexes fuse into a single alternation link
+        assert len(lexer._chain) == 1
+        _matcher, labels = lexer._chain[0]
+        assert labels == {"g0": "VBG", "g1": "NNS", "g2": "NN"}
+
+        results = [(t.value, t.label) for t in lexer.lex_strings(["kings", "running", "dog"])]
+        # "kings" matches both .*s$ and .*: the earliest matcher wins
+        expected = [("kings", "NNS"), ("running", "VBG"), ("dog", "NN")]
+        assert results == expected
+
+    def test_Lexer_does_not_fuse_unsafe_patterns(self):
+        matchers = [
+            (r"(a)\1$", "AA"),
+            (r"(?P<x>b+)$", "BB"),
+            (r".*", "NN"),
+        ]
+        lexer = Lexer(matchers)
+        # backreferences and named groups cannot be renumbered: each pattern
+        # stays a single link with its label untouched
+        assert len(lexer._chain) == 3
+        assert [labels for _m, labels in lexer._chain] == ["AA", "BB", "NN"]
+
+        results = [(t.value, t.label) for t in lexer.lex_strings(["aa", "bbb", "ab"])]
+        expected = [("aa", "AA"), ("bbb", "BB"), ("ab", "NN")]
+        assert results == expected
+
+    def test_Lexer_splits_fused_runs_over_the_group_limit(self):
+        matchers = [(rf"^word{i}$", f"L{i}") for i in range(150)]
+        lexer = Lexer(matchers)
+        # 150 one-group patterns do not fit the 99-group cap: the run splits
+        # into several fused buckets that together cover every matcher
+        assert len(lexer._chain) > 1
+        assert all(labels.__class__ is dict for _m, labels in lexer._chain)
+        assert sum(len(labels) for _m, labels in lexer._chain) == 150
+
+        results = [(t.value, t.label) for t in lexer.lex_strings(["word0", "word120"])]
+        expected = [("word0", "L0"), ("word120", "L120")]
+        assert results == expected
+
+    def test_Lexer_accepts_non_string_labels_in_single_links(self):
+        def callable_matcher(s):
+            return s == "maybe"
+
+        matchers = [
+            (r"(x)\1$", None),
+            (callable_matcher, None),
+            (r".*", "NN"),
+        ]
+        lexer = Lexer(matchers)
+        results = [(t.value, t.label) for t in lexer.lex_strings(["xx", "maybe", "dog"])]
+        expected = [("xx", None), ("maybe", None), ("dog", "NN")]
+        assert results == expected